@@ -3,11 +3,43 @@ AXION Core Inference Kernel
 Pure logical inference rules - no domain-specific knowledge
 """
 
-from dataclasses import dataclass, field
-from typing import List, Set, Dict, Optional, Tuple, Any
+from dataclasses import dataclass, field, fields, replace
+from typing import List, Set, Dict, Optional, Tuple, Any, Callable, Sequence, Iterable
 from enum import Enum
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import hashlib
-import json
+import operator
+import os
+import re
+import tempfile
+import weakref
+
+from core import json_codec
+
+def _json_default(obj: Any) -> Any:
+    """
+    Encode kernel objects directly, without an intermediate dict
+    Proof steps become positional arrays in field-declaration order
+    """
+    if isinstance(obj, ProofStep):
+        return (obj.statement.content, obj.rule.value,
+                [p.content for p in obj.premises], obj.justification, obj.line_number)
+    if isinstance(obj, Expression):
+        return obj.content
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _canonical_json(data: Any) -> bytes:
+    """Compact, key-sorted UTF-8 JSON"""
+    return json_codec.dumps(data, _json_default, sort_keys=True)
+
+def _wire_json(data: Any) -> bytes:
+    """
+    Compact UTF-8 JSON without key sorting
+    Canonical by construction for the positional encodings used in proof hashing
+    """
+    return json_codec.dumps(data, _json_default)
 
 class LogicalConnective(Enum):
     """Fundamental logical operators"""
@@ -36,33 +68,148 @@ class InferenceRule(Enum):
     TRANSITIVITY = "transitivity"
     AXIOM_APPLICATION = "axiom_application"
 
-@dataclass
+# Top-level operator codes; binary connectives are ordered loosest-binding first
+OP_NONE = -1
+OP_IMPL, OP_OR, OP_AND, OP_EQ = 0, 1, 2, 3
+OP_FORALL, OP_EXISTS = 4, 5
+_OP_SYMBOLS = ("⟹", "∨", "∧", "=", "∀", "∃")
+_BINARY_OP_CODES = {"⟹": OP_IMPL, "∨": OP_OR, "∧": OP_AND, "=": OP_EQ}
+_OPEN_BRACKETS = "([{"
+_CLOSE_BRACKETS = ")]}"
+
+def _strip_outer_parens(text: str) -> str:
+    """Remove parentheses that enclose the whole formula"""
+    while text.startswith("(") and text.endswith(")"):
+        depth = 0
+        for i, char in enumerate(text):
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+        if i != len(text) - 1:
+            break
+        text = text[1:-1].strip()
+    return text
+
+def _top_split(text: str) -> Tuple[int, int]:
+    """
+    (op_code, index) of the loosest top-level binary connective in one pass
+    The first occurrence wins among equals; (OP_NONE, -1) if there is none
+    """
+    best_code, best_index = OP_NONE, -1
+    depth = 0
+    for i, char in enumerate(text):
+        if char in _OPEN_BRACKETS:
+            depth += 1
+        elif char in _CLOSE_BRACKETS:
+            depth -= 1
+        elif depth == 0:
+            code = _BINARY_OP_CODES.get(char)
+            if code is not None and (best_code == OP_NONE or code < best_code):
+                best_code, best_index = code, i
+    return best_code, best_index
+
+def _analyse_formula(content: str) -> Tuple[str, int, int]:
+    """
+    (body, op_code, index) for a formula, body being its unwrapped text
+    For quantified formulas index points at the ':' or '.' after the variables
+    """
+    body = _strip_outer_parens(content.strip())
+    if body[:1] in ("∀", "∃"):
+        # A leading quantifier scopes over the rest of the formula
+        index = body.find(":")
+        if index < 0:
+            index = body.find(".")
+        if index < 0:
+            return body, OP_NONE, -1
+        return body, OP_FORALL if body[0] == "∀" else OP_EXISTS, index
+    op_code, index = _top_split(body)
+    return body, op_code, index
+
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
 class Expression:
-    """Mathematical expression/formula"""
+    """
+    Mathematical expression/formula
+    Immutable: instances are hashed once and shared through Expression.make
+    """
     content: str
     variables: Set[str] = field(default_factory=set)
     free_variables: Set[str] = field(default_factory=set)
     bound_variables: Set[str] = field(default_factory=set)
     type_signature: Optional[str] = None
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
+    _top_split: Optional[Tuple[str, int, int]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash(self.content))
+    
+    def __reduce__(self):
+        # Rebuild through __init__ so the cached hash matches the loading process
+        return (type(self), (self.content, self.variables, self.free_variables,
+                             self.bound_variables, self.type_signature))
+    
+    @property
+    def top_split(self) -> Tuple[str, int, int]:
+        """(body, op_code, index) of the top-level operator, computed on first access"""
+        if self._top_split is None:
+            object.__setattr__(self, "_top_split", _analyse_formula(self.content))
+        return self._top_split
+    
+    @property
+    def parsed(self) -> Optional[Tuple[str, str, str]]:
+        """
+        Top-level structure as (op, left, right), or None for atoms
+        Quantified formulas give (quantifier, variable, body); operands are
+        unwrapped like top_split's body
+        """
+        body, op_code, index = self.top_split
+        if op_code == OP_NONE:
+            return None
+        start = 1 if op_code >= OP_FORALL else 0
+        return (_OP_SYMBOLS[op_code], _strip_outer_parens(body[start:index].strip()),
+                _strip_outer_parens(body[index + 1:].strip()))
+    
+    @classmethod
+    def make(cls, content: str) -> 'Expression':
+        """
+        Canonical (interned) expression for this content
+        """
+        expr = _EXPR_POOL.get(content)
+        if expr is None:
+            expr = cls(content)
+            _EXPR_POOL[content] = expr
+        return expr
     
     def __hash__(self):
-        return hash(self.content)
+        return self._hash
     
     def __eq__(self, other):
-        return isinstance(other, Expression) and self.content == other.content
+        return self is other or (isinstance(other, Expression) and self.content == other.content)
     
     def __repr__(self):
         return f"Expr({self.content})"
 
-@dataclass
+# Flyweight pool behind Expression.make; entries vanish once unreferenced
+_EXPR_POOL: 'weakref.WeakValueDictionary[str, Expression]' = weakref.WeakValueDictionary()
+
+@dataclass(frozen=True, slots=True)
 class ProofStep:
-    """Single step in a formal proof"""
+    """
+    Single step in a formal proof
+    Immutable, so a proof only changes by changing its list of steps
+    """
     statement: Expression
     rule: InferenceRule
-    premises: List[Expression] = field(default_factory=list)
+    premises: Tuple[Expression, ...] = ()
     justification: str = ""
     line_number: int = 0
     
+    def __post_init__(self):
+        if not isinstance(self.premises, tuple):
+            object.__setattr__(self, "premises", tuple(self.premises))
+    
     def to_dict(self) -> Dict:
         return {
             "statement": self.statement.content,
@@ -72,8 +219,59 @@ class ProofStep:
             "line": self.line_number
         }
 
-@dataclass
-class Proof:
+# Stable small-integer code for each inference rule
+_RULE_CODES: Dict[InferenceRule, int] = {rule: code for code, rule in enumerate(InferenceRule)}
+
+class _StepColumns:
+    """
+    Structure-of-arrays encoding of a proof's steps
+    Premises of step i are premise_flat[premise_offsets[i]:premise_offsets[i + 1]].
+    Per-step columns may be preallocated; only the first `count` entries are live.
+    """
+    __slots__ = ("rule_codes", "statement_ids", "premise_offsets", "premise_flat", "count")
+    
+    def __init__(self, capacity: int = 0):
+        self.rule_codes = array("b", bytes(capacity))
+        self.statement_ids = array("i", bytes(capacity * array("i").itemsize))
+        self.premise_offsets = array("i", bytes((capacity + 1) * array("i").itemsize))
+        self.premise_flat = array("i")
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def append(self, rule_code: int, statement_id: int, premise_ids: List[int]):
+        i = self.count
+        self.premise_flat.extend(premise_ids)
+        if i < len(self.statement_ids):
+            self.rule_codes[i] = rule_code
+            self.statement_ids[i] = statement_id
+            self.premise_offsets[i + 1] = len(self.premise_flat)
+        else:
+            self.rule_codes.append(rule_code)
+            self.statement_ids.append(statement_id)
+            self.premise_offsets.append(len(self.premise_flat))
+        self.count = i + 1
+
+class _ProofCaches:
+    """
+    Transient per-proof state, kept in slots outside the dataclass fields so
+    fields(), asdict(), comparison, pickling and copies never see it
+    """
+    __slots__ = ("_hasher", "_hashed_header", "_hashed", "_id_of", "_columns", "_encoded")
+    
+    def _reset_caches(self):
+        self._hasher = None
+        self._hashed_header = b""
+        # Steps absorbed into _hasher, compared by identity to spot edits
+        self._hashed: List[ProofStep] = []
+        self._id_of: Dict[str, int] = {}
+        self._columns = _StepColumns()
+        # Steps the columns were built from, compared by identity to spot edits
+        self._encoded: List[ProofStep] = []
+
+@dataclass(slots=True)
+class Proof(_ProofCaches):
     """Complete formal proof with cryptographic verification"""
     theorem: Expression
     axioms_used: Set[str] = field(default_factory=set)
@@ -82,115 +280,288 @@ class Proof:
     theory_context: str = "Pure Logic"
     is_valid: bool = False
     proof_hash: Optional[str] = None
+    # Bitmask over AxiomLibrary axiom IDs, kept alongside axioms_used
+    axioms_mask: int = 0
+    
+    def __post_init__(self):
+        self._reset_caches()
+    
+    def __getstate__(self):
+        # Only the proof itself; the digest (not picklable) and the step
+        # encoding are rebuilt on demand
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+    
+    def __setstate__(self, state):
+        self.__init__(**state)
+    
+    def _absorb_steps(self):
+        """Stream steps not yet hashed into the running digest"""
+        header = _wire_json((self.theorem.content, self.theory_context))
+        steps = self.steps
+        hashed = self._hashed
+        if (self._hasher is None or header != self._hashed_header
+                or len(hashed) > len(steps) or not all(map(operator.is_, hashed, steps))):
+            # First use, or the header or earlier steps changed - start over
+            self._hasher = hashlib.sha256(header)
+            self._hashed_header = header
+            hashed.clear()
+        update = self._hasher.update
+        for step in steps[len(hashed):]:
+            update(_wire_json(step))
+            hashed.append(step)
+    
+    def uses_axiom(self, axiom_id: int) -> bool:
+        """Whether the axiom with this library ID is recorded in axioms_mask"""
+        return bool(self.axioms_mask >> axiom_id & 1)
+    
+    def _intern(self, content: str) -> int:
+        """Proof-local integer ID for a statement"""
+        return self._id_of.setdefault(content, len(self._id_of))
+    
+    def _encode_steps(self):
+        """Bring the integer columns up to date with steps"""
+        steps = self.steps
+        encoded = self._encoded
+        if len(encoded) > len(steps) or not all(map(operator.is_, encoded, steps)):
+            # Steps were removed or replaced - start over
+            self._columns = _StepColumns(len(steps))
+            self._id_of = {}
+            encoded.clear()
+        columns = self._columns
+        intern = self._intern
+        for step in steps[len(encoded):]:
+            columns.append(_RULE_CODES[step.rule], intern(step.statement.content),
+                           [intern(p.content) for p in step.premises])
+            encoded.append(step)
     
     def compute_hash(self) -> str:
         """Cryptographic hash of entire proof"""
-        proof_data = {
-            "theorem": self.theorem.content,
-            "axioms": sorted(list(self.axioms_used)),
-            "steps": [step.to_dict() for step in self.steps],
-            "assumptions": [a.content for a in self.assumptions],
-            "theory": self.theory_context
-        }
-        proof_json = json.dumps(proof_data, sort_keys=True)
-        return hashlib.sha256(proof_json.encode()).hexdigest()
+        self._absorb_steps()
+        hasher = self._hasher.copy()
+        hasher.update(_wire_json((sorted(self.axioms_used),
+                                  [a.content for a in self.assumptions])))
+        return hasher.hexdigest()
     
     def finalize(self):
         """Mark proof as complete and compute hash"""
         self.proof_hash = self.compute_hash()
         self.is_valid = True
-        
+    
+    def copy(self) -> 'Proof':
+        """Independent copy; steps and expressions are immutable and shared"""
+        return replace(self, axioms_used=set(self.axioms_used), steps=list(self.steps),
+                       assumptions=list(self.assumptions))
+    
+    def to_json(self) -> bytes:
+        """Serialize the proof; steps are streamed as positional arrays"""
+        return _canonical_json({
+            "theorem": self.theorem,
+            "theory": self.theory_context,
+            "axioms": sorted(self.axioms_used),
+            "assumptions": self.assumptions,
+            "steps": self.steps,
+            "is_valid": self.is_valid,
+            "proof_hash": self.proof_hash,
+            "axioms_mask": self.axioms_mask
+        })
+    
+    @classmethod
+    def from_json(cls, data: bytes) -> 'Proof':
+        """Rebuild a proof serialized with to_json"""
+        decoded = json_codec.loads(data)
+        make = Expression.make
+        proof = cls(
+            theorem=make(decoded["theorem"]),
+            axioms_used=set(decoded["axioms"]),
+            assumptions=[make(a) for a in decoded["assumptions"]],
+            theory_context=decoded["theory"],
+            is_valid=decoded["is_valid"],
+            proof_hash=decoded["proof_hash"],
+            axioms_mask=decoded.get("axioms_mask", 0)
+        )
+        proof.steps = [
+            ProofStep(
+                statement=make(statement),
+                rule=InferenceRule(rule),
+                premises=tuple(make(p) for p in premises),
+                justification=justification,
+                line_number=line_number
+            )
+            for statement, rule, premises, justification, line_number in decoded["steps"]
+        ]
+        return proof
+    
     def __repr__(self):
         status = "✓ Valid" if self.is_valid else "⧗ Incomplete"
         return f"Proof[{status}]: {self.theorem.content} ({len(self.steps)} steps)"
 
+def _validate_proof_core(rule_ok: Sequence[int], statement_ids: Sequence[int],
+                         premise_offsets: Sequence[int], premise_flat: Sequence[int],
+                         assumption_ids: Sequence[int], id_count: int) -> int:
+    """
+    Index of the first invalid step, or -1 if every step checks out
+    A step is invalid if its rule check failed or it cites a premise that is
+    not yet established. Integer arrays in, integer out: this is the piece to
+    swap for a compiled implementation without touching the kernel.
+    """
+    # Presence bitmap over the proof's dense statement IDs
+    available = bytearray(id_count)
+    for statement_id in assumption_ids:
+        available[statement_id] = 1
+    for i in range(len(statement_ids)):
+        if not rule_ok[i]:
+            return i
+        for k in range(premise_offsets[i], premise_offsets[i + 1]):
+            if not available[premise_flat[k]]:
+                return i
+        available[statement_ids[i]] = 1
+    return -1
+
+@functools.lru_cache(maxsize=256)
+def _substitution_pattern(keys: frozenset) -> 're.Pattern[str]':
+    """Alternation of all keys, longest first so overlapping keys prefer the longer one"""
+    ordered = sorted(keys, key=lambda k: (-len(k), k))
+    return re.compile("|".join(re.escape(k) for k in ordered))
+
+# Per-process kernel used by validate_many workers
+_worker_kernel: Optional['InferenceKernel'] = None
+
+def _init_validation_worker():
+    global _worker_kernel
+    _worker_kernel = InferenceKernel()
+
+def _validate_encoded(data: bytes) -> bool:
+    """Worker entry point: decode one serialized proof and validate it"""
+    return _worker_kernel.validate_proof(Proof.from_json(data))
+
+def _proof_key(theorem: Expression, theory: str,
+               assumptions: Sequence[Expression]) -> Tuple[str, str, Tuple[str, ...]]:
+    """Cache key: a proof only answers for the assumptions it was built from"""
+    return theorem.content, theory, tuple(a.content for a in assumptions)
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".axion", "cache")
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
 class InferenceKernel:
     """
     Pure logical inference engine
     No mathematical knowledge - only formal rules
     """
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        """
+        Args:
+            cache_dir: Directory for persisting finalized proofs across runs
+                       (e.g. DEFAULT_CACHE_DIR); None keeps the cache in memory
+            max_cache_bytes: Size budget of cache_dir before least recently
+                             used proofs are evicted
+        """
         self.proof_cache: Dict[str, Proof] = {}
+        self._proof_index: Dict[Tuple[str, str, Tuple[str, ...]], str] = {}
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.max_cache_bytes = max_cache_bytes
+        self._cache_bytes: Optional[int] = None
+        # Rule-specific validators; rules without an entry are accepted as-is
+        self._validators: Dict[InferenceRule, Callable[[ProofStep], bool]] = {
+            InferenceRule.MODUS_PONENS: self._validate_modus_ponens,
+            InferenceRule.TRANSITIVITY: self._validate_transitivity,
+        }
         
     def modus_ponens(self, implication: Expression, antecedent: Expression) -> Optional[Expression]:
         """
         If (P ⟹ Q) and P, then Q
         """
-        # Simple pattern matching for implications
-        if "⟹" in implication.content:
-            parts = implication.content.split("⟹")
-            if len(parts) == 2:
-                premise = parts[0].strip()
-                conclusion = parts[1].strip()
-                if premise == antecedent.content.strip():
-                    return Expression(content=conclusion)
+        body, op_code, index = implication.top_split
+        # Both sides compared unwrapped, so (P ⟹ Q) ⟹ R accepts P ⟹ Q
+        if (op_code == OP_IMPL
+                and _strip_outer_parens(body[:index].strip()) == antecedent.top_split[0]):
+            return Expression.make(body[index + 1:].strip())
         return None
     
+    def specialize_modus_ponens(self, implication: Expression) -> Callable[[Expression], Optional[Expression]]:
+        """
+        Modus ponens specialised to one implication P ⟹ Q
+        Returns f(antecedent) giving Q when antecedent is P and None otherwise;
+        hold on to it when the same implication meets many antecedents
+        """
+        body, op_code, index = implication.top_split
+        if op_code != OP_IMPL:
+            return lambda antecedent: None
+        premise = _strip_outer_parens(body[:index].strip())
+        conclusion = Expression.make(body[index + 1:].strip())
+        
+        def apply(antecedent: Expression) -> Optional[Expression]:
+            return conclusion if antecedent.top_split[0] == premise else None
+        return apply
+    
     def universal_instantiation(self, universal: Expression, instance: str) -> Optional[Expression]:
         """
         From ∀x.P(x), derive P(t) for any term t
         """
-        if universal.content.startswith("∀"):
-            # Extract variable and body
-            # Simple parser: ∀x: P(x) or ∀x.P(x)
-            content = universal.content[1:]  # Remove ∀
-            if ":" in content:
-                var, body = content.split(":", 1)
-            elif "." in content:
-                var, body = content.split(".", 1)
-            else:
-                return None
-            
-            var = var.strip()
-            body = body.strip()
+        # Simple parser: ∀x: P(x) or ∀x.P(x)
+        body, op_code, index = universal.top_split
+        if op_code == OP_FORALL:
+            var = body[1:index].strip()
             
             # Substitute instance for variable
-            instantiated = body.replace(var, instance)
-            return Expression(content=instantiated)
+            instantiated = body[index + 1:].strip().replace(var, instance)
+            return Expression.make(instantiated)
         return None
     
     def substitution(self, expr: Expression, substitutions: Dict[str, str]) -> Expression:
         """
         Replace variables/terms according to substitution map
         """
-        result = expr.content
-        for old, new in substitutions.items():
-            result = result.replace(old, new)
-        return Expression(content=result)
+        # All replacements happen in one simultaneous pass, so a replacement
+        # is never itself rewritten by a later entry
+        keys = frozenset(k for k in substitutions if k)
+        if not keys:
+            return Expression.make(expr.content)
+        pattern = _substitution_pattern(keys)
+        return Expression.make(pattern.sub(lambda m: substitutions[m.group(0)], expr.content))
     
     def conjunction_intro(self, expr1: Expression, expr2: Expression) -> Expression:
         """
         From P and Q, derive P ∧ Q
         """
-        return Expression(content=f"({expr1.content} ∧ {expr2.content})")
+        return Expression.make(f"({expr1.content} ∧ {expr2.content})")
     
     def conjunction_elim_left(self, conjunction: Expression) -> Optional[Expression]:
         """
         From P ∧ Q, derive P
         """
-        if "∧" in conjunction.content:
-            parts = conjunction.content.split("∧")
-            if len(parts) >= 2:
-                left = parts[0].strip().strip("()")
-                return Expression(content=left)
+        body, op_code, index = conjunction.top_split
+        if op_code == OP_AND:
+            return Expression.make(body[:index].strip())
         return None
     
     def conjunction_elim_right(self, conjunction: Expression) -> Optional[Expression]:
         """
         From P ∧ Q, derive Q
         """
-        if "∧" in conjunction.content:
-            parts = conjunction.content.split("∧")
-            if len(parts) >= 2:
-                right = parts[-1].strip().strip("()")
-                return Expression(content=right)
+        body, op_code, index = conjunction.top_split
+        if op_code == OP_AND:
+            return Expression.make(body[index + 1:].strip())
         return None
     
     def transitivity(self, expr1: Expression, expr2: Expression, relation: str = "=") -> Optional[Expression]:
         """
         From a = b and b = c, derive a = c
         """
+        relation_code = _BINARY_OP_CODES.get(relation)
+        if relation_code is not None:
+            body1, op1, index1 = expr1.top_split
+            body2, op2, index2 = expr2.top_split
+            if op1 == relation_code and op2 == relation_code:
+                b1 = body1[index1 + 1:].strip()
+                b2 = body2[:index2].strip()
+                if b1 == b2:
+                    a = body1[:index1].strip()
+                    c = body2[index2 + 1:].strip()
+                    return Expression.make(f"{a} {relation} {c}")
+            return None
+        
         if relation in expr1.content and relation in expr2.content:
             parts1 = expr1.content.split(relation)
             parts2 = expr2.content.split(relation)
@@ -200,15 +571,156 @@ class InferenceKernel:
                 b2, c = parts2[0].strip(), parts2[1].strip()
                 
                 if b1 == b2:
-                    return Expression(content=f"{a} {relation} {c}")
+                    return Expression.make(f"{a} {relation} {c}")
         return None
     
+    def cache_proof(self, proof: Proof):
+        """
+        Remember a finalized proof, keyed by its hash
+        Also persisted to cache_dir when one is configured. Validation does
+        not cache: only callers that built the proof themselves should, since
+        lookup_proof hands it back as a theorem.
+        """
+        if not proof.is_valid or not proof.proof_hash:
+            return
+        proof_hash = proof.proof_hash
+        # A private copy, so later edits by the caller cannot reach the cache
+        self.proof_cache[proof_hash] = proof.copy()
+        key = _proof_key(proof.theorem, proof.theory_context, proof.assumptions)
+        self._proof_index[key] = proof_hash
+        
+        if self.cache_dir:
+            proof_path = self._proof_path(proof_hash)
+            if not os.path.exists(proof_path):
+                data = proof.to_json()
+                self._write_atomic(proof_path, data)
+                if self._cache_bytes is not None:
+                    self._cache_bytes += len(data)
+            index_path = self._index_path(key)
+            if self._cache_bytes is not None and not os.path.exists(index_path):
+                self._cache_bytes += len(proof_hash)
+            self._write_atomic(index_path, proof_hash.encode())
+            self._evict()
+    
+    def lookup_proof(self, theorem: Expression, theory: str = "Pure Logic",
+                     assumptions: Sequence[Expression] = ()) -> Optional[Proof]:
+        """
+        Previously finalized proof of a theorem in a theory from exactly these
+        assumptions, if cached
+        Returns a copy, so callers may modify it freely
+        """
+        key = _proof_key(theorem, theory, assumptions)
+        proof_hash = self._proof_index.get(key)
+        if proof_hash is not None:
+            return self.proof_cache[proof_hash].copy()
+        if not self.cache_dir:
+            return None
+        
+        index_path = self._index_path(key)
+        try:
+            with open(index_path, "rb") as f:
+                proof_hash = f.read().decode()
+        except (OSError, ValueError):
+            return None
+        proof_path = self._proof_path(proof_hash)
+        try:
+            with open(proof_path, "rb") as f:
+                proof = Proof.from_json(f.read())
+        except FileNotFoundError:
+            # The proof was evicted; drop the dangling index entry
+            self._remove(index_path)
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        # Only trust cache entries whose content still matches their hash
+        if proof.compute_hash() != proof_hash:
+            return None
+        for path in (proof_path, index_path):
+            try:
+                os.utime(path)  # mark as recently used
+            except OSError:
+                pass
+        self.proof_cache[proof_hash] = proof
+        self._proof_index[key] = proof_hash
+        return proof.copy()
+    
+    def _proof_path(self, proof_hash: str) -> str:
+        return os.path.join(self.cache_dir, proof_hash[:2], f"{proof_hash}.json")
+    
+    def _index_path(self, key: Tuple[str, str, Tuple[str, ...]]) -> str:
+        key_hash = hashlib.sha256(_canonical_json(list(key))).hexdigest()
+        return os.path.join(self.cache_dir, "index", key_hash)
+    
+    def _write_atomic(self, path: str, data: bytes):
+        """Write via a temporary file and os.replace so readers never see partial files"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def _remove(self, path: str):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    
+    def _cached_files(self) -> List[Tuple[float, int, str]]:
+        """
+        (mtime, size, path) of every file in cache_dir: proofs in their shards
+        and index entries. Files another process removes mid-scan are skipped
+        """
+        files = []
+        with os.scandir(self.cache_dir) as shards:
+            for shard in shards:
+                try:
+                    if not shard.is_dir():
+                        continue
+                    with os.scandir(shard.path) as entries:
+                        for entry in entries:
+                            if entry.name.endswith(".tmp"):
+                                continue
+                            try:
+                                if entry.is_file():
+                                    stat = entry.stat()
+                                    files.append((stat.st_mtime, stat.st_size, entry.path))
+                            except FileNotFoundError:
+                                pass
+                except FileNotFoundError:
+                    pass
+        return files
+    
+    def _evict(self):
+        """
+        Drop least recently used files once cache_dir exceeds its budget
+        Index entries age like proofs; one left pointing at an evicted proof
+        is removed when it is next looked up
+        """
+        if self._cache_bytes is None:
+            self._cache_bytes = sum(size for _, size, _ in self._cached_files())
+        if self._cache_bytes <= self.max_cache_bytes:
+            return
+        
+        files = sorted(self._cached_files())
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_cache_bytes:
+                break
+            total -= size
+            self._remove(path)
+        self._cache_bytes = total
+    
     def create_proof(self, theorem: Expression, theory: str = "Pure Logic") -> Proof:
         """
         Initialize a new proof object
         """
-        proof = Proof(theorem=theorem, theory_context=theory)
-        return proof
+        return Proof(theorem=theorem, theory_context=theory)
     
     def add_step(self, proof: Proof, statement: Expression, rule: InferenceRule, 
                  premises: List[Expression] = None, justification: str = "") -> ProofStep:
@@ -218,14 +730,14 @@ class InferenceKernel:
         step = ProofStep(
             statement=statement,
             rule=rule,
-            premises=premises or [],
+            premises=tuple(premises or ()),
             justification=justification,
             line_number=len(proof.steps) + 1
         )
         proof.steps.append(step)
         return step
     
-    def validate_step(self, step: ProofStep, available_statements: List[Expression]) -> bool:
+    def validate_step(self, step: ProofStep, available_statements: Set[Expression]) -> bool:
         """
         Verify that an inference step is valid
         """
@@ -234,33 +746,77 @@ class InferenceKernel:
             if premise not in available_statements:
                 return False
         
-        # Rule-specific validation
-        if step.rule == InferenceRule.MODUS_PONENS:
-            if len(step.premises) != 2:
-                return False
-            result = self.modus_ponens(step.premises[0], step.premises[1])
-            return result is not None and result.content == step.statement.content
-        
-        # Add more rule validations as needed
-        return True
+        return self._check_rule(step)
+    
+    def _check_rule(self, step: ProofStep) -> bool:
+        """Rule-specific validation, assuming the premises are available"""
+        validator = self._validators.get(step.rule)
+        return validator(step) if validator else True
+    
+    def _validate_modus_ponens(self, step: ProofStep) -> bool:
+        premises = step.premises
+        if len(premises) != 2:
+            return False
+        result = self.modus_ponens(premises[0], premises[1])
+        return result is not None and result.content == step.statement.content
+    
+    def _validate_transitivity(self, step: ProofStep) -> bool:
+        premises = step.premises
+        if len(premises) != 2:
+            return False
+        parsed = step.statement.parsed
+        if not parsed or parsed[0] != "=":
+            # The relation is not recorded on the step; only equality chains are checked
+            return True
+        result = self.transitivity(premises[0], premises[1])
+        return result is not None and result.parsed == parsed
     
     def validate_proof(self, proof: Proof) -> bool:
         """
         Validate entire proof from axioms to conclusion
         """
-        available = list(proof.assumptions)
+        proof._encode_steps()
+        columns = proof._columns
+        steps = proof.steps
+        assumption_ids = array("i", [proof._intern(a.content) for a in proof.assumptions])
         
-        for step in proof.steps:
-            if not self.validate_step(step, available):
-                return False
-            available.append(step.statement)
+        # Rule-specific checks, through the same table as validate_step
+        count = len(columns)
+        rule_ok = bytearray(map(self._check_rule, steps))
+        
+        if _validate_proof_core(rule_ok, columns.statement_ids[:count],
+                                columns.premise_offsets[:count + 1], columns.premise_flat,
+                                assumption_ids, len(proof._id_of)) >= 0:
+            return False
         
         # Check that final step proves the theorem
-        if proof.steps:
-            final = proof.steps[-1].statement
+        if steps:
+            final = steps[-1].statement
             if final.content == proof.theorem.content:
                 proof.is_valid = True
                 proof.finalize()
                 return True
         
         return False
+    
+    def validate_many(self, proofs: Iterable[Proof], workers: Optional[int] = None) -> List[bool]:
+        """
+        Validate independent proofs in parallel worker processes
+        Returns one result per proof, in order; valid proofs are finalized
+        here exactly as validate_proof would do
+        """
+        proofs = list(proofs)
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(proofs) < 2:
+            return [self.validate_proof(proof) for proof in proofs]
+        
+        encoded = [proof.to_json() for proof in proofs]
+        chunksize = max(1, len(encoded) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=min(workers, len(encoded)),
+                                 initializer=_init_validation_worker) as pool:
+            results = list(pool.map(_validate_encoded, encoded, chunksize=chunksize))
+        
+        for proof, is_valid in zip(proofs, results):
+            if is_valid:
+                proof.finalize()
+        return results
@@ -0,0 +1,36 @@
+"""
+AXION JSON Codec
+UTF-8 JSON shared by the kernel and the session manager
+"""
+
+from typing import Any, Callable, Optional
+import json
+
+try:
+    import orjson
+except ImportError:  # optional accelerator - stdlib json is the fallback
+    orjson = None
+
+def dumps(data: Any, default: Optional[Callable[[Any], Any]] = None,
+          sort_keys: bool = False, indent: bool = False) -> bytes:
+    """
+    Compact UTF-8 JSON, or two-space indented with indent=True
+    Identical bytes with or without orjson; dataclasses always go through default
+    """
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=option)
+    return json.dumps(data, default=default, sort_keys=sort_keys,
+                      indent=2 if indent else None,
+                      separators=(",", ": ") if indent else (",", ":"),
+                      ensure_ascii=False).encode()
+
+def loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -163,19 +163,25 @@ def example_6_direct_library_modification():
     print("=" * 70)
     
     template = '''
-# Add this to axioms/axiom_library.py in _initialize_standard_theories():
+# Add this to axioms/axiom_library.py and register it in _STANDARD_THEORIES:
 
 # === YOUR THEORY NAME ===
-your_theory = AxiomTheory(
-    name="YourTheoryName",
-    description="Brief description of your theory",
-    dependencies={"DependentTheory1", "DependentTheory2"},  # Optional
-    reference="Citation or source reference"
-)
-your_theory.add_axiom("axiom_1_name", "∀x: P(x)")
-your_theory.add_axiom("axiom_2_name", "∀x,y: R(x,y) ⟹ S(x)")
-your_theory.add_axiom("axiom_3_name", "Definition or theorem statement")
-self.theories["YourTheoryName"] = your_theory
+def _build_your_theory() -> AxiomTheory:
+    your_theory = AxiomTheory(
+        name="YourTheoryName",
+        description="Brief description of your theory",
+        dependencies={"DependentTheory1", "DependentTheory2"},  # Optional
+        reference="Citation or source reference"
+    )
+    your_theory.add_axiom("axiom_1_name", "∀x: P(x)")
+    your_theory.add_axiom("axiom_2_name", "∀x,y: R(x,y) ⟹ S(x)")
+    your_theory.add_axiom("axiom_3_name", "Definition or theorem statement")
+    return your_theory
+
+_STANDARD_THEORIES = {
+    # ... existing theories ...
+    "YourTheoryName": _build_your_theory,
+}
 '''
     
     print("\nTo add a theory permanently, edit axiom_library.py:")
@@ -3,11 +3,12 @@ AXION Proof Session Manager
 Manages proof history, theorem database, and verification
 """
 
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
+from collections import Counter
 from core.inference_kernel import Proof, Expression
+from core import json_codec
 
 @dataclass
 class ProofRecord:
@@ -16,33 +17,31 @@ class ProofRecord:
     theory: str
     proof_hash: str
     timestamp: str
-    axioms_used: List[str]
+    axioms_used: Set[str]
     step_count: int
     is_valid: bool
     
-    def to_dict(self) -> Dict:
-        return {
-            "theorem": self.theorem,
-            "theory": self.theory,
-            "proof_hash": self.proof_hash,
-            "timestamp": self.timestamp,
-            "axioms_used": self.axioms_used,
-            "step_count": self.step_count,
-            "is_valid": self.is_valid
-        }
-    
     @classmethod
-    def from_proof(cls, proof: Proof) -> 'ProofRecord':
+    def from_proof(cls, proof: Proof, now_iso: Optional[str] = None) -> 'ProofRecord':
+        """Record a proof; pass now_iso to share one timestamp across a batch"""
         return cls(
             theorem=proof.theorem.content,
             theory=proof.theory_context,
             proof_hash=proof.proof_hash or "",
-            timestamp=datetime.now().isoformat(),
-            axioms_used=list(proof.axioms_used),
+            timestamp=now_iso or datetime.now().isoformat(),
+            axioms_used=set(proof.axioms_used),
             step_count=len(proof.steps),
             is_valid=proof.is_valid
         )
 
+def _record_default(obj):
+    """Serialize records directly, without building a dict per record first"""
+    if isinstance(obj, ProofRecord):
+        return vars(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class ProofSession:
     """
     Session manager for AXION
@@ -51,26 +50,32 @@ class ProofSession:
     
     def __init__(self):
         self.proof_history: List[ProofRecord] = []
-        self.theorem_database: Dict[str, List[ProofRecord]] = {}
+        # Theorems seen so far; records for one theorem can be filtered from proof_history
+        self.theorem_database: Set[str] = set()
         self.current_context: str = "Logic"
+        # proof_hash -> first record with that hash
+        self._hash_index: Dict[str, ProofRecord] = {}
         
     def add_proof(self, proof: Proof):
         """Register a completed proof"""
-        record = ProofRecord.from_proof(proof)
+        self._register(ProofRecord.from_proof(proof))
+    
+    def add_proofs(self, proofs: Iterable[Proof]):
+        """Register several completed proofs under a single timestamp"""
+        now_iso = datetime.now().isoformat()
+        for proof in proofs:
+            self._register(ProofRecord.from_proof(proof, now_iso))
+    
+    def _register(self, record: ProofRecord):
+        """Append a record and update the theorem database and hash index"""
         self.proof_history.append(record)
-        
-        # Add to theorem database
-        theorem_key = proof.theorem.content
-        if theorem_key not in self.theorem_database:
-            self.theorem_database[theorem_key] = []
-        self.theorem_database[theorem_key].append(record)
+        self.theorem_database.add(record.theorem)
+        if record.proof_hash:
+            self._hash_index.setdefault(record.proof_hash, record)
     
     def get_proof_by_hash(self, proof_hash: str) -> Optional[ProofRecord]:
         """Retrieve proof by its cryptographic hash"""
-        for record in self.proof_history:
-            if record.proof_hash == proof_hash:
-                return record
-        return None
+        return self._hash_index.get(proof_hash)
     
     def list_proofs(self, theory: Optional[str] = None) -> List[ProofRecord]:
         """List all proofs, optionally filtered by theory"""
@@ -100,16 +105,19 @@ class ProofSession:
                 "proof_count": len(self.proof_history),
                 "context": self.current_context
             },
-            "proofs": [p.to_dict() for p in self.proof_history]
+            # Records and their axiom sets are encoded by _record_default,
+            # without building a dict per record first
+            "proofs": self.proof_history
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(json_codec.dumps(data, _record_default, indent=True))
     
     def import_session(self, filepath: str):
         """Import session from JSON"""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        data = json_codec.loads(raw)
         
         for proof_dict in data.get("proofs", []):
             record = ProofRecord(
@@ -117,38 +125,34 @@ class ProofSession:
                 theory=proof_dict["theory"],
                 proof_hash=proof_dict["proof_hash"],
                 timestamp=proof_dict["timestamp"],
-                axioms_used=proof_dict["axioms_used"],
+                axioms_used=set(proof_dict["axioms_used"]),
                 step_count=proof_dict["step_count"],
                 is_valid=proof_dict["is_valid"]
             )
-            self.proof_history.append(record)
-            
-            # Rebuild theorem database
-            if record.theorem not in self.theorem_database:
-                self.theorem_database[record.theorem] = []
-            self.theorem_database[record.theorem].append(record)
+            self._register(record)
     
     def statistics(self) -> Dict:
         """Get session statistics"""
-        theories_used = set(p.theory for p in self.proof_history)
-        valid_proofs = sum(1 for p in self.proof_history if p.is_valid)
-        
-        axiom_usage = {}
-        for proof in self.proof_history:
-            for axiom in proof.axioms_used:
-                axiom_usage[axiom] = axiom_usage.get(axiom, 0) + 1
+        # Single pass over the history for every aggregate
+        theories_used = set()
+        valid_proofs = 0
+        axiom_usage = Counter()
+        for record in self.proof_history:
+            theories_used.add(record.theory)
+            if record.is_valid:
+                valid_proofs += 1
+            axiom_usage.update(record.axioms_used)
         
         return {
             "total_proofs": len(self.proof_history),
             "valid_proofs": valid_proofs,
             "theories_used": list(theories_used),
             "unique_theorems": len(self.theorem_database),
-            "most_used_axioms": sorted(axiom_usage.items(), 
-                                      key=lambda x: x[1], 
-                                      reverse=True)[:5]
+            "most_used_axioms": axiom_usage.most_common(5)
         }
     
     def clear_history(self):
         """Clear all session history"""
         self.proof_history.clear()
         self.theorem_database.clear()
+        self._hash_index.clear()
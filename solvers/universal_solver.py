@@ -3,14 +3,217 @@ AXION Universal Solver
 Strategies for theorem proving and symbolic computation
 """
 
+import functools
+import operator
 import re
-from typing import List, Dict, Optional, Set, Tuple, Any
+from typing import List, Dict, Mapping, Optional, Set, Tuple, Any
 from dataclasses import dataclass
 from core.inference_kernel import (
-    Expression, Proof, ProofStep, InferenceRule, InferenceKernel
+    Expression, Proof, InferenceRule, InferenceKernel
 )
 from axioms.axiom_library import AxiomLibrary
 
+@functools.lru_cache(maxsize=64)
+def _power_pattern(var: str) -> "re.Pattern[str]":
+    """Compiled matcher for ``var^n``"""
+    return re.compile(rf"{var}\^(\d+)")
+
+@functools.lru_cache(maxsize=64)
+def _poly_pattern(var: str) -> "re.Pattern[str]":
+    """Compiled matcher for ``c*var^n``"""
+    return re.compile(rf"(\d+)\*{var}\^(\d+)")
+
+# Algebraic simplification rules, applied as one fused alternation where the
+# matched group names the rule that fired
+_SIMPLIFICATION_RULES = [
+    (r"x \+ 0", "x"),
+    (r"0 \+ x", "x"),
+    (r"x \* 1", "x"),
+    (r"1 \* x", "x"),
+    (r"x \* 0", "0"),
+    (r"0 \* x", "0"),
+    (r"x \- x", "0"),
+    (r"x / x", "1"),
+    (r"x \^ 0", "1"),
+    (r"x \^ 1", "x"),
+]
+_FUSED_SIMPLIFICATION = re.compile("|".join(
+    f"(?P<r{i}>{pattern})" for i, (pattern, _) in enumerate(_SIMPLIFICATION_RULES)
+))
+_SIMPLIFICATION_REPLACEMENTS = {
+    f"r{i}": replacement for i, (_, replacement) in enumerate(_SIMPLIFICATION_RULES)
+}
+
+def _apply_rule(match: "re.Match[str]") -> str:
+    return _SIMPLIFICATION_REPLACEMENTS[match.lastgroup]
+
+# The CAS operations below are pure functions of their strings, so they are
+# memoized; recursive calls on shared subterms hit the cache
+
+@functools.lru_cache(maxsize=8192)
+def _simp(expr: str) -> str:
+    result = expr
+    
+    # One scan per sweep over the fused rules, until a fixed point
+    for _ in range(100):
+        new_result = _FUSED_SIMPLIFICATION.sub(_apply_rule, result)
+        if new_result == result:
+            break
+        result = new_result
+    
+    return result
+
+def _parse_monomial(expr: str, var: str) -> Optional[Tuple[int, int]]:
+    """(coefficient, power) for c, var, var^n, c*var or c*var^n; None otherwise"""
+    expr = expr.strip()
+    if expr.isdecimal():
+        return int(expr), 0
+    coefficient, star, power = expr.partition("*")
+    if star:
+        coefficient = coefficient.strip()
+        if not coefficient.isdecimal():
+            return None
+        expr = power.strip()
+    if expr == var:
+        n = 1
+    elif expr.startswith(var + "^") and expr[len(var) + 1:].isdecimal():
+        n = int(expr[len(var) + 1:])
+    else:
+        return None
+    return (int(coefficient) if star else 1), n
+
+def _diff_monomial(c: int, n: int, var: str) -> str:
+    """Power rule for c*var^n, formatted like the general rules"""
+    c, n = c * n, n - 1
+    if c == 0:
+        return "0"
+    elif n == 0:
+        return str(c)
+    elif n == 1:
+        return f"{c}*{var}"
+    else:
+        return f"{c}*{var}^{n}"
+
+@functools.lru_cache(maxsize=8192)
+def _diff(expr: str, var: str) -> str:
+    expr = expr.strip()
+    
+    # Constant rule
+    if var not in expr:
+        return "0"
+    
+    # Variable rule: d/dx[x] = 1
+    if expr == var:
+        return "1"
+    
+    # Monomials c*x^n (the common case): integer arithmetic only, no regex
+    monomial = _parse_monomial(expr, var)
+    if monomial is not None:
+        return _diff_monomial(*monomial, var)
+    
+    # Sum rule: d/dx[f + g] = f' + g', split before the prefix-matching
+    # patterns below so no term is dropped
+    parts = _top_level_split(expr, "+")
+    if len(parts) > 1:
+        return " + ".join(_diff(part.strip(), var) for part in parts)
+    
+    # Power rule: d/dx[x^n] = n*x^(n-1)
+    match = _power_pattern(var).match(expr)
+    if match:
+        n = int(match.group(1))
+        if n == 0:
+            return "0"
+        elif n == 1:
+            return "1"
+        elif n == 2:
+            return f"2*{var}"
+        else:
+            return f"{n}*{var}^{n-1}"
+    
+    # Polynomial terms: d/dx[c*x^n]
+    match = _poly_pattern(var).match(expr)
+    if match:
+        c = int(match.group(1))
+        n = int(match.group(2))
+        if n == 0:
+            return "0"
+        elif n == 1:
+            return str(c)
+        elif n == 2:
+            return f"{c*n}*{var}"
+        else:
+            return f"{c*n}*{var}^{n-1}"
+    
+    # Product rule: d/dx[f*g] = f'*g + f*g'
+    parts = _top_level_split(expr, "*")
+    if len(parts) > 1:
+        f, g = parts[0].strip(), "*".join(parts[1:]).strip()
+        f_prime = _diff(f, var)
+        g_prime = _diff(g, var)
+        return f"({f_prime})*({g}) + ({f})*({g_prime})"
+    
+    # Default: return symbolic notation
+    return f"d/d{var}[{expr}]"
+
+def _top_level_split(expr: str, operator: str) -> List[str]:
+    """Split on operator outside parentheses, in one pass; [expr] if there is none"""
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(expr):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == operator and depth == 0:
+            parts.append(expr[start:i])
+            start = i + 1
+    if not parts:
+        return [expr]
+    parts.append(expr[start:])
+    return parts
+
+def _integrate_term(expr: str, var: str) -> str:
+    """Integrate a single term (no top-level sum); never recurses"""
+    # Constant rule
+    if var not in expr:
+        return f"{expr}*{var}"
+    
+    # Variable rule: ∫x dx = x^2/2
+    if expr == var:
+        return f"{var}^2/2"
+    
+    # Power rule: ∫x^n dx = x^(n+1)/(n+1)
+    match = _power_pattern(var).match(expr)
+    if match:
+        n = int(match.group(1))
+        return f"{var}^{n+1}/{n+1}"
+    
+    # Polynomial terms: ∫c*x^n dx
+    match = _poly_pattern(var).match(expr)
+    if match:
+        c = int(match.group(1))
+        n = int(match.group(2))
+        return f"{c}*{var}^{n+1}/{n+1}"
+    
+    # Default: return symbolic notation
+    return f"∫{expr} d{var}"
+
+@functools.lru_cache(maxsize=8192)
+def _int(expr: str, var: str) -> str:
+    expr = expr.strip()
+    
+    # Constant rule
+    if var not in expr:
+        return f"{expr}*{var}"
+    
+    # Linearity: ∫(f + g) dx = ∫f dx + ∫g dx, split once up front
+    parts = _top_level_split(expr, "+")
+    if len(parts) > 1:
+        return " + ".join(_integrate_term(part.strip(), var) for part in parts)
+    
+    return _integrate_term(expr, var)
+
 class SolverStrategy:
     """Base class for solving strategies"""
     
@@ -22,87 +225,160 @@ class SolverStrategy:
         """Override in subclasses"""
         raise NotImplementedError
 
+# Terms tried when instantiating universal statements
+_INSTANTIATION_TERMS = ("0", "1", "x", "a", "n")
+
 class TheoremProver(SolverStrategy):
     """
     Automated theorem proving using forward/backward chaining
     """
     
+    def __init__(self, kernel: InferenceKernel, library: AxiomLibrary):
+        super().__init__(kernel, library)
+        # theory name -> (axiom_items it was built from, compiled axioms)
+        self._compiled_axioms: Dict[str, Tuple[tuple, Tuple[Tuple[Expression, str, str, int], ...]]] = {}
+    
+    def _axiom_steps(self, theory: str, theory_obj) -> Tuple[Tuple[Expression, str, str, int], ...]:
+        """
+        (expression, qualified name, justification, mask bit) per axiom,
+        built once per theory and rebuilt whenever its axioms change
+        """
+        items = theory_obj.axiom_items
+        cached = self._compiled_axioms.get(theory)
+        if cached is not None and cached[0] is items:
+            return cached[1]
+        compiled = tuple(
+            (Expression.make(statement), f"{theory}.{name}", f"Axiom: {theory}.{name}",
+             1 << self.library.axiom_id(theory, name))
+            for name, statement in items
+        )
+        self._compiled_axioms[theory] = (items, compiled)
+        return compiled
+    
     def prove(self, theorem: str, theory: str = "Logic", 
               max_steps: int = 100) -> Optional[Proof]:
         """
         Attempt to prove a theorem using axioms from specified theory
         """
-        theorem_expr = Expression(content=theorem)
-        proof = self.kernel.create_proof(theorem_expr, theory)
+        theorem_expr = Expression.make(theorem)
         
         # Get axioms from theory
         theory_obj = self.library.get_theory(theory)
         if not theory_obj:
             print(f"Theory '{theory}' not found")
             return None
+        axiom_steps = self._axiom_steps(theory, theory_obj)
+        
+        # Reuse an earlier proof from exactly the theory's current axioms
+        # (kept in memory or on disk), if this search would have found it
+        cached = self.kernel.lookup_proof(theorem_expr, theory,
+                                          [axiom_expr for axiom_expr, *_ in axiom_steps])
+        if cached is not None and self._rounds_needed(cached) < max_steps:
+            # Bits follow this library's axiom IDs, not those of whichever
+            # process wrote the cache entry
+            cached.axioms_mask = functools.reduce(
+                operator.or_, (bit for *_, bit in axiom_steps), 0)
+            return cached
+        
+        proof = self.kernel.create_proof(theorem_expr, theory)
         
-        # Add axioms as assumptions
-        for axiom_name, axiom_statement in theory_obj.axioms.items():
-            axiom_expr = Expression(content=axiom_statement)
+        # Add axioms as assumptions, each also recorded as a step
+        for axiom_expr, qualified_name, justification, bit in axiom_steps:
             proof.assumptions.append(axiom_expr)
-            proof.axioms_used.add(f"{theory}.{axiom_name}")
-            
-            # Add axiom as first step
-            step = ProofStep(
-                statement=axiom_expr,
-                rule=InferenceRule.AXIOM_APPLICATION,
-                justification=f"Axiom: {theory}.{axiom_name}"
-            )
+            proof.axioms_used.add(qualified_name)
+            proof.axioms_mask |= bit
             self.kernel.add_step(proof, axiom_expr, InferenceRule.AXIOM_APPLICATION,
-                                justification=f"Axiom: {theory}.{axiom_name}")
+                                justification=justification)
         
-        # Try to derive theorem (simple forward chaining)
+        # Try to derive theorem (simple forward chaining, semi-naive: each
+        # round only pairs newly derived statements with what is known)
         derived = set(proof.assumptions)
+        derived_content = {expr.content for expr in derived}
+        frontier = list(dict.fromkeys(proof.assumptions))
         
         for _ in range(max_steps):
             # Check if we've proven the theorem
-            if theorem_expr in derived:
+            if theorem_expr.content in derived_content:
                 proof.is_valid = True
                 proof.finalize()
+                self.kernel.cache_proof(proof)
                 return proof
             
             # Try applying inference rules
-            new_derivations = self._apply_rules(list(derived), proof)
-            if not new_derivations:
+            frontier = self._apply_rules(frontier, derived, proof)
+            if not frontier:
                 break
-            derived.update(new_derivations)
+            derived.update(frontier)
+            derived_content.update(expr.content for expr in frontier)
         
         return proof
     
-    def _apply_rules(self, statements: List[Expression], proof: Proof) -> Set[Expression]:
-        """Apply inference rules to derive new statements"""
-        new = set()
-        
-        # Try modus ponens on all pairs
-        for s1 in statements:
-            for s2 in statements:
-                if "⟹" in s1.content:
-                    result = self.kernel.modus_ponens(s1, s2)
-                    if result and result not in statements:
-                        self.kernel.add_step(proof, result, InferenceRule.MODUS_PONENS,
-                                           premises=[s1, s2],
-                                           justification="Modus ponens")
-                        new.add(result)
-        
-        # Try universal instantiation
-        for s in statements:
+    @staticmethod
+    def _rounds_needed(proof: Proof) -> int:
+        """Forward-chaining rounds prove needs before it sees the proof's theorem"""
+        depth = {assumption: 0 for assumption in proof.assumptions}
+        for step in proof.steps:
+            if step.statement not in depth:
+                depth[step.statement] = 1 + max(
+                    (depth.get(premise, 0) for premise in step.premises), default=0)
+        return depth.get(proof.theorem, 0)
+    
+    def _apply_rules(self, frontier: List[Expression], derived: Set[Expression],
+                     proof: Proof) -> List[Expression]:
+        """
+        Apply inference rules to derive new statements
+        Only combinations involving at least one frontier statement are tried;
+        derived must already contain the frontier
+        """
+        # Insertion-ordered set of results, returned as the next frontier
+        new: Dict[Expression, None] = {}
+        fresh = set(frontier)
+        
+        # Modus ponens as hash joins on the antecedent text, unwrapped on
+        # both sides as modus_ponens compares it
+        by_antecedent: Dict[str, List[Expression]] = {}
+        by_content: Dict[str, List[Expression]] = {}
+        for s in derived:
+            by_content.setdefault(s.top_split[0], []).append(s)
+            parsed = s.parsed
+            if parsed and parsed[0] == "⟹":
+                by_antecedent.setdefault(parsed[1], []).append(s)
+        
+        def apply_modus_ponens(s1: Expression, s2: Expression):
+            result = self.kernel.modus_ponens(s1, s2)
+            if result and result not in derived:
+                self.kernel.add_step(proof, result, InferenceRule.MODUS_PONENS,
+                                   premises=[s1, s2],
+                                   justification="Modus ponens")
+                new[result] = None
+        
+        # New antecedents against every implication...
+        for s2 in frontier:
+            for s1 in by_antecedent.get(s2.top_split[0], ()):
+                apply_modus_ponens(s1, s2)
+        # ...and new implications against older antecedents
+        for s1 in frontier:
+            parsed = s1.parsed
+            if parsed and parsed[0] == "⟹":
+                for s2 in by_content.get(parsed[1], ()):
+                    if s2 not in fresh:
+                        apply_modus_ponens(s1, s2)
+        
+        # Try universal instantiation; a statement is on the frontier exactly
+        # once per proof, so each (universal, term) pair is tried only once
+        for s in frontier:
             if s.content.startswith("∀"):
                 # Try instantiating with common terms
-                for term in ["0", "1", "x", "a", "n"]:
+                for term in _INSTANTIATION_TERMS:
                     result = self.kernel.universal_instantiation(s, term)
-                    if result and result not in statements:
+                    if result and result not in derived:
                         self.kernel.add_step(proof, result, 
                                            InferenceRule.UNIVERSAL_INSTANTIATION,
                                            premises=[s],
                                            justification=f"Universal instantiation with {term}")
-                        new.add(result)
+                        new[result] = None
         
-        return new
+        return list(new)
 
 class SymbolicManipulator(SolverStrategy):
     """
@@ -110,157 +386,23 @@ class SymbolicManipulator(SolverStrategy):
     Symbolic manipulation, simplification, differentiation, integration
     """
     
-    def __init__(self, kernel: InferenceKernel, library: AxiomLibrary):
-        super().__init__(kernel, library)
-        self.simplification_rules = self._load_simplification_rules()
-    
-    def _load_simplification_rules(self) -> List[Tuple[str, str]]:
-        """Load algebraic simplification rules"""
-        return [
-            (r"x \+ 0", "x"),
-            (r"0 \+ x", "x"),
-            (r"x \* 1", "x"),
-            (r"1 \* x", "x"),
-            (r"x \* 0", "0"),
-            (r"0 \* x", "0"),
-            (r"x \- x", "0"),
-            (r"x / x", "1"),
-            (r"x \^ 0", "1"),
-            (r"x \^ 1", "x"),
-        ]
-    
     def simplify(self, expr: str) -> str:
         """
         Algebraic simplification
         """
-        result = expr
-        
-        # Apply simplification rules iteratively
-        changed = True
-        iterations = 0
-        max_iterations = 100
-        
-        while changed and iterations < max_iterations:
-            changed = False
-            for pattern, replacement in self.simplification_rules:
-                new_result = re.sub(pattern, replacement, result)
-                if new_result != result:
-                    result = new_result
-                    changed = True
-            iterations += 1
-        
-        return result
+        return _simp(expr)
     
     def differentiate(self, expr: str, var: str = "x") -> str:
         """
         Symbolic differentiation using calculus axioms
         """
-        expr = expr.strip()
-        
-        # Constant rule
-        if var not in expr:
-            return "0"
-        
-        # Variable rule: d/dx[x] = 1
-        if expr == var:
-            return "1"
-        
-        # Power rule: d/dx[x^n] = n*x^(n-1)
-        power_pattern = rf"{var}\^(\d+)"
-        match = re.match(power_pattern, expr)
-        if match:
-            n = int(match.group(1))
-            if n == 0:
-                return "0"
-            elif n == 1:
-                return "1"
-            elif n == 2:
-                return f"2*{var}"
-            else:
-                return f"{n}*{var}^{n-1}"
-        
-        # Polynomial terms: d/dx[c*x^n]
-        poly_pattern = rf"(\d+)\*{var}\^(\d+)"
-        match = re.match(poly_pattern, expr)
-        if match:
-            c = int(match.group(1))
-            n = int(match.group(2))
-            if n == 0:
-                return "0"
-            elif n == 1:
-                return str(c)
-            elif n == 2:
-                return f"{c*n}*{var}"
-            else:
-                return f"{c*n}*{var}^{n-1}"
-        
-        # Sum rule: d/dx[f + g] = f' + g'
-        if "+" in expr and not self._is_in_parens(expr, "+"):
-            parts = expr.split("+")
-            derivatives = [self.differentiate(part.strip(), var) for part in parts]
-            return " + ".join(derivatives)
-        
-        # Product rule: d/dx[f*g] = f'*g + f*g'
-        if "*" in expr and not self._is_in_parens(expr, "*"):
-            parts = expr.split("*", 1)
-            if len(parts) == 2:
-                f, g = parts[0].strip(), parts[1].strip()
-                f_prime = self.differentiate(f, var)
-                g_prime = self.differentiate(g, var)
-                return f"({f_prime})*({g}) + ({f})*({g_prime})"
-        
-        # Default: return symbolic notation
-        return f"d/d{var}[{expr}]"
-    
-    def _is_in_parens(self, expr: str, operator: str) -> bool:
-        """Check if operator is inside parentheses"""
-        depth = 0
-        for char in expr:
-            if char == "(":
-                depth += 1
-            elif char == ")":
-                depth -= 1
-            elif char == operator and depth == 0:
-                return False
-        return True
+        return _diff(expr, var)
     
     def integrate(self, expr: str, var: str = "x") -> str:
         """
         Symbolic integration using calculus axioms
         """
-        expr = expr.strip()
-        
-        # Constant rule
-        if var not in expr:
-            return f"{expr}*{var}"
-        
-        # Variable rule: ∫x dx = x^2/2
-        if expr == var:
-            return f"{var}^2/2"
-        
-        # Power rule: ∫x^n dx = x^(n+1)/(n+1)
-        power_pattern = rf"{var}\^(\d+)"
-        match = re.match(power_pattern, expr)
-        if match:
-            n = int(match.group(1))
-            return f"{var}^{n+1}/{n+1}"
-        
-        # Polynomial terms: ∫c*x^n dx
-        poly_pattern = rf"(\d+)\*{var}\^(\d+)"
-        match = re.match(poly_pattern, expr)
-        if match:
-            c = int(match.group(1))
-            n = int(match.group(2))
-            return f"{c}*{var}^{n+1}/{n+1}"
-        
-        # Linearity: ∫(f + g) dx = ∫f dx + ∫g dx
-        if "+" in expr:
-            parts = expr.split("+")
-            integrals = [self.integrate(part.strip(), var) for part in parts]
-            return " + ".join(integrals)
-        
-        # Default: return symbolic notation
-        return f"∫{expr} d{var}"
+        return _int(expr, var)
     
     def solve_equation(self, equation: str, var: str = "x") -> List[str]:
         """
@@ -293,8 +435,13 @@ class UniversalSolver:
     Dispatches to appropriate strategy based on problem type
     """
     
-    def __init__(self):
-        self.kernel = InferenceKernel()
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Directory where proofs are persisted across runs
+                       (e.g. DEFAULT_CACHE_DIR); None keeps them in memory
+        """
+        self.kernel = InferenceKernel(cache_dir=cache_dir)
         self.library = AxiomLibrary()
         self.prover = TheoremProver(self.kernel, self.library)
         self.manipulator = SymbolicManipulator(self.kernel, self.library)
@@ -355,9 +502,12 @@ class UniversalSolver:
             return "differentiate"
         elif "simplify" in problem_lower:
             return "simplify"
-        elif "=" in problem and not any(q in problem for q in ["∀", "∃", "⟹"]):
+        
+        # Quantifier markers only matter from here on; plain C-level scans
+        has_quantifier = "∀" in problem or "∃" in problem or "⟹" in problem
+        if "=" in problem and not has_quantifier:
             return "solve"
-        elif any(q in problem for q in ["∀", "∃", "⟹", "prove", "show that"]):
+        elif has_quantifier or "prove" in problem or "show that" in problem:
             return "prove"
         else:
             return "simplify"
@@ -374,8 +524,8 @@ class UniversalSolver:
         """List all available mathematical theories"""
         return self.library.list_theories()
     
-    def get_axioms(self, theory: str) -> Dict[str, str]:
-        """Get all axioms from a theory"""
+    def get_axioms(self, theory: str) -> Mapping[str, str]:
+        """Get all axioms from a theory (read-only view)"""
         theory_obj = self.library.get_theory(theory)
         if theory_obj:
             return theory_obj.axioms
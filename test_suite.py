@@ -3,12 +3,16 @@ AXION Test Suite
 Comprehensive tests for all functionality
 """
 
+import os
+import shutil
 import sys
+import tempfile
 sys.path.append('..')
 
 from solvers.universal_solver import UniversalSolver
 from session.proof_session import ProofSession
-from core.inference_kernel import InferenceKernel, Expression, InferenceRule
+from core.inference_kernel import InferenceKernel, Expression, InferenceRule, ProofStep
+from axioms.axiom_library import AxiomLibrary
 
 def test_theories():
     """Test theory listing and axiom retrieval"""
@@ -29,6 +33,21 @@ def test_theories():
         assert len(axioms) > 0, f"Theory {theory_name} has no axioms"
         print(f"✓ {theory_name:20} has {len(axioms):2} axioms")
     
+    # Test 3: Axiom IDs do not depend on the order theories are loaded in
+    other_first = AxiomLibrary()
+    other_first.get_theory("Peano")
+    if other_first.axiom_id("Logic", "identity") == AxiomLibrary().axiom_id("Logic", "identity"):
+        print("✓ Axiom IDs independent of load order")
+    else:
+        print("✗ Axiom IDs depend on load order")
+    
+    # Test 4: The axioms show up in a theory's repr
+    logic = solver.library.get_theory("Logic")
+    if f"axioms={dict(logic.axioms)!r}" in repr(logic):
+        print("✓ Theory repr lists its axioms")
+    else:
+        print("✗ Theory repr omits its axioms")
+    
     print()
 
 def test_differentiation():
@@ -44,6 +63,9 @@ def test_differentiation():
         ("x^2", "2*x"),
         ("x^3", "3*x^2"),
         ("5*x^2", "10*x"),
+        ("2*x", "2"),
+        ("x^2 + x", "2*x + 1"),
+        ("x^2 + sin(x)", "2*x + d/dx[sin(x)]"),
     ]
     
     for expr, expected in test_cases:
@@ -65,6 +87,7 @@ def test_integration():
         ("x", "x^2/2"),
         ("x^2", "x^3/3"),
         ("x^3", "x^4/4"),
+        ("x^2 + x", "x^3/3 + x^2/2"),
     ]
     
     for expr, expected in test_cases:
@@ -154,6 +177,16 @@ def test_session_management():
     except Exception as e:
         print(f"✗ Export failed: {e}")
     
+    # Batch registration shares one timestamp
+    batch = ProofSession()
+    batch.add_proofs(solver.solve(theorem, using=theory, problem_type="prove")
+                     for theorem, theory in theorems)
+    timestamps = {record.timestamp for record in batch.proof_history}
+    if len(batch.proof_history) == len(theorems) and len(timestamps) == 1:
+        print("✓ Batch of proofs recorded under one timestamp")
+    else:
+        print("✗ Batch registration failed")
+    
     print()
 
 def test_custom_axioms():
@@ -206,6 +239,33 @@ def test_inference_rules():
     else:
         print("✗ Modus ponens failed")
     
+    apply = kernel.specialize_modus_ponens(p_implies_q)
+    result = apply(p)
+    if (result and result.content == "Q" and apply(Expression("Q")) is None
+            and kernel.specialize_modus_ponens(p)(p) is None):
+        print("✓ Specialized modus ponens works")
+    else:
+        print("✗ Specialized modus ponens failed")
+    
+    # Formula parser: nested, parenthesised and quantified formulas
+    nested = kernel.modus_ponens(Expression("(P ⟹ Q) ⟹ R"), Expression("P ⟹ Q"))
+    wrapped = kernel.modus_ponens(Expression("(P) ⟹ Q"), Expression("(P)"))
+    if (nested and nested.content == "R" and wrapped and wrapped.content == "Q"
+            and Expression("(P ∧ Q) ⟹ R").parsed == ("⟹", "P ∧ Q", "R")
+            and Expression("∀x: (x = x)").parsed == ("∀", "x", "x = x")):
+        print("✓ Nested and quantified formulas parsed")
+    else:
+        print("✗ Formula parsing failed")
+    
+    solver = UniversalSolver()
+    solver.add_theory("Nested", "Nested implications",
+                      {"p": "P", "p_q": "P ⟹ Q", "nested": "(P ⟹ Q) ⟹ R"})
+    proof = solver.solve("R", using="Nested", problem_type="prove")
+    if proof and proof.is_valid:
+        print("✓ Prover chains through a nested implication")
+    else:
+        print("✗ Prover missed a nested implication")
+    
     # Test 2: Universal Instantiation
     universal = Expression("∀x: P(x)")
     result = kernel.universal_instantiation(universal, "a")
@@ -235,6 +295,22 @@ def test_inference_rules():
     else:
         print("✗ Transitivity failed")
     
+    # Test 5: Substitution is simultaneous, so a swap does not cascade
+    result = kernel.substitution(Expression("f(x, y)"), {"x": "y", "y": "x"})
+    
+    if result.content == "f(y, x)":
+        print("✓ Substitution works")
+    else:
+        print(f"✗ Substitution failed: {result.content}")
+    
+    # Longer keys win over keys they contain
+    result = kernel.substitution(Expression("xx + x"), {"x": "a", "xx": "b"})
+    
+    if result.content == "b + a":
+        print("✓ Overlapping substitution keys resolved longest first")
+    else:
+        print(f"✗ Overlapping substitution failed: {result.content}")
+    
     print()
 
 def test_auto_detection():
@@ -290,6 +366,132 @@ def test_proof_validation():
     else:
         print("✗ Valid proof rejected")
     
+    # Replacing a step must invalidate the earlier encoding of the proof
+    proof.steps[2] = ProofStep(statement=q, rule=InferenceRule.MODUS_PONENS,
+                               premises=[p_implies_q, Expression("UNPROVEN")])
+    if not kernel.validate_proof(proof):
+        print("✓ Step citing an unproven premise rejected")
+    else:
+        print("✗ Step citing an unproven premise accepted")
+    
+    print()
+
+def test_batch_validation():
+    """Test validating many proofs in worker processes"""
+    print("=" * 70)
+    print("TEST: Batch Validation")
+    print("=" * 70)
+    
+    kernel = InferenceKernel()
+    p_implies_q = Expression("P ⟹ Q")
+    p = Expression("P")
+    q = Expression("Q")
+    
+    def make_proof(valid: bool):
+        proof = kernel.create_proof(q)
+        proof.assumptions = [p_implies_q, p] if valid else [p_implies_q]
+        kernel.add_step(proof, q, InferenceRule.MODUS_PONENS, premises=[p_implies_q, p])
+        return proof
+    
+    expected = [True, False, True, False, True]
+    proofs = [make_proof(valid) for valid in expected]
+    
+    # workers=2 with several proofs takes the process-pool path
+    results = kernel.validate_many(proofs, workers=2)
+    if results == expected:
+        print("✓ Results returned in input order")
+    else:
+        print(f"✗ Unexpected results: {results}")
+    
+    if all(proof.is_valid and proof.proof_hash for proof, ok in zip(proofs, expected) if ok):
+        print("✓ Valid proofs finalized")
+    else:
+        print("✗ Valid proofs not finalized")
+    
+    if not any(proof.is_valid or proof.proof_hash for proof, ok in zip(proofs, expected) if not ok):
+        print("✓ Invalid proofs left unfinalized")
+    else:
+        print("✗ Invalid proof finalized")
+    
+    sequential = [kernel.validate_proof(make_proof(valid)) for valid in expected]
+    if sequential == results:
+        print("✓ Parallel results match sequential validation")
+    else:
+        print("✗ Parallel results differ from sequential validation")
+    
+    print()
+
+def test_proof_cache():
+    """Test proof caching in memory and on disk"""
+    print("=" * 70)
+    print("TEST: Proof Cache")
+    print("=" * 70)
+    
+    cache_dir = tempfile.mkdtemp()
+    try:
+        solver = UniversalSolver(cache_dir=cache_dir)
+        
+        # A proof validated from non-axiom assumptions must not become a theorem
+        kernel = solver.kernel
+        false_eq = Expression("0 = 1")
+        proof = kernel.create_proof(false_eq, "Peano")
+        proof.assumptions = [false_eq]
+        kernel.add_step(proof, false_eq, InferenceRule.AXIOM_APPLICATION)
+        kernel.validate_proof(proof)
+        result = solver.solve("0 = 1", using="Peano", problem_type="prove")
+        if not result.is_valid:
+            print("✓ Proof from foreign assumptions not reused")
+        else:
+            print("✗ Proof from foreign assumptions reused")
+        
+        # Validation accepts rules it has no checker for, so it must not cache
+        peano = [Expression.make(statement)
+                 for _, statement in solver.library.get_theory("Peano").axiom_items]
+        proof = kernel.create_proof(false_eq, "Peano")
+        proof.assumptions = list(peano)
+        kernel.add_step(proof, false_eq, InferenceRule.SUBSTITUTION)
+        kernel.validate_proof(proof)
+        result = solver.solve("0 = 1", using="Peano", problem_type="prove")
+        if not result.is_valid and proof.proof_hash not in kernel.proof_cache:
+            print("✓ Validated proofs not cached")
+        else:
+            print("✗ Validated proof reused by the prover")
+        
+        # Proofs persist across solvers sharing a cache directory
+        first = solver.solve("∀x: x = x", using="Logic", problem_type="prove")
+        cached = UniversalSolver(cache_dir=cache_dir).kernel.lookup_proof(
+            first.theorem, "Logic", first.assumptions)
+        if cached is not None and cached.proof_hash == first.proof_hash and cached is not first:
+            print("✓ Proof reloaded from disk cache")
+        else:
+            print("✗ Proof not reloaded from disk cache")
+        
+        reloaded = UniversalSolver(cache_dir=cache_dir).solve(
+            "∀x: x = x", using="Logic", problem_type="prove")
+        if reloaded.axioms_mask == first.axioms_mask != 0:
+            print("✓ Axiom bitmask survives the disk cache")
+        else:
+            print("✗ Axiom bitmask lost in the disk cache")
+        
+        # Changing the theory invalidates earlier proofs
+        solver.add_axiom("Logic", "extra", "R")
+        second = solver.solve("∀x: x = x", using="Logic", problem_type="prove")
+        if second.proof_hash != first.proof_hash:
+            print("✓ Cached proof dropped after theory change")
+        else:
+            print("✗ Stale proof returned after theory change")
+        
+        # Eviction keeps the directory within its budget
+        tiny = InferenceKernel(cache_dir=cache_dir, max_cache_bytes=0)
+        tiny.cache_proof(second)
+        remaining = sum(len(files) for _, _, files in os.walk(cache_dir))
+        if remaining == 0:
+            print("✓ Cache evicted down to its size budget")
+        else:
+            print(f"✗ {remaining} file(s) left after eviction")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    
     print()
 
 def run_all_tests():
@@ -311,6 +513,8 @@ def run_all_tests():
         test_inference_rules,
         test_auto_detection,
         test_proof_validation,
+        test_batch_validation,
+        test_proof_cache,
     ]
     
     passed = 0